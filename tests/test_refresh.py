@@ -0,0 +1,79 @@
+import pytest
+from temporalio.exceptions import ApplicationError
+from volleyball_aggregator.models.team import content_hash
+from volleyball_aggregator.workflows.refresh import (
+    _is_due,
+    _new_freshness,
+    _observe_teams,
+    _update_listings,
+    check_refresh_options
+)
+
+URL = "https://example.edu/sports/womens-volleyball/roster"
+
+def _team(players):
+    """A reference to a scraped team, as returned by scrape_source."""
+    team_data = {
+        "school_name": "Example University",
+        "division": "NCAA_D1",
+        "website_url": URL,
+        "players": [{"name": name} for name in players]
+    }
+    return {
+        "website_url": URL,
+        "school_name": team_data["school_name"],
+        "content_hash": content_hash(team_data),
+        "path": "/dev/null"
+    }
+
+def _freshness(**fields):
+    return {**_new_freshness(), **fields}
+
+def test_new_and_pending_teams_are_due():
+    assert _is_due(_freshness(), 1, 8)
+    # A change that has not been stored yet is retried on the next cycle
+    assert _is_due(_freshness(observed_hash="b", stored_hash="a", checks=20, last_checked_cycle=9), 10, 8)
+
+def test_rarely_changing_teams_back_off_up_to_the_limit():
+    stable = _freshness(observed_hash="a", stored_hash="a", checks=3, changes=0, last_checked_cycle=10)
+    # Change rate 1/4: re-scraped every 4 cycles
+    assert not _is_due(stable, 13, 8)
+    assert _is_due(stable, 14, 8)
+
+    never_changes = _freshness(observed_hash="a", stored_hash="a", checks=100, last_checked_cycle=10)
+    assert not _is_due(never_changes, 17, 8)
+    assert _is_due(never_changes, 18, 8)
+
+def test_frequently_changing_teams_are_due_every_cycle():
+    volatile = _freshness(observed_hash="a", stored_hash="a", checks=4, changes=4, last_checked_cycle=10)
+    assert _is_due(volatile, 11, 8)
+
+def test_team_listed_by_two_sources_is_checked_once():
+    teams = {}
+    _observe_teams(teams, [_team(["Ana"])], 1)
+
+    observed = _observe_teams(teams, [_team(["Ana", "Bea"]), _team(["Ana", "Bea"])], 2)
+
+    assert list(observed) == [URL]
+    assert teams[URL]["checks"] == 1
+    assert teams[URL]["changes"] == 1
+
+def test_failed_listing_does_not_age_its_teams():
+    teams = {URL: _freshness(source="NCAA_D1")}
+
+    _update_listings(teams, {"CANADIAN": {"https://other.ca/roster"}})
+    assert teams[URL]["missed_listings"] == 0
+
+    _update_listings(teams, {"NCAA_D1": set(), "CANADIAN": set()})
+    assert teams[URL]["missed_listings"] == 1
+
+    _update_listings(teams, {"NCAA_D3": {URL}})
+    assert teams[URL] == _freshness(source="NCAA_D3")
+
+def test_refresh_options_are_required():
+    check_refresh_options({"interval_seconds": 60, "max_backoff_cycles": 8, "prune_after_cycles": 4})
+
+    with pytest.raises(ApplicationError, match="prune_after_cycles"):
+        check_refresh_options({"interval_seconds": 60, "max_backoff_cycles": 8})
+    with pytest.raises(ApplicationError, match="max_backoff_cycles"):
+        check_refresh_options({"interval_seconds": 60, "max_backoff_cycles": 0, "prune_after_cycles": 4})
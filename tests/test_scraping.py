@@ -0,0 +1,53 @@
+import asyncio
+from typing import List
+from volleyball_aggregator.activities.scraping import collect_teams
+from volleyball_aggregator.models.team import Team
+from volleyball_aggregator.scrapers.base import BaseScraper
+from volleyball_aggregator.storage import load_team
+
+URLS = [f"https://example.edu/team-{i}" for i in range(4)]
+
+class FakeScraper(BaseScraper):
+    def __init__(self):
+        super().__init__("https://example.edu")
+        self.scraped: List[str] = []
+
+    async def get_team_list(self) -> List[str]:
+        return URLS
+
+    async def scrape_team(self, team_url: str) -> Team:
+        self.scraped.append(team_url)
+        return Team(school_name=team_url.rsplit("/", 1)[1], division="NCAA_D1", website_url=team_url)
+
+async def _collect(scraper, directory, start, beats):
+    async with scraper:
+        return await collect_teams(scraper, [URLS[1]], directory, start, beats.append)
+
+def test_collect_teams_writes_files_and_heartbeats_a_cursor(tmp_path):
+    beats = []
+    refs = asyncio.run(_collect(FakeScraper(), tmp_path, 0, beats))
+
+    assert beats == [1, 2, 3, 4]
+    assert sorted(ref["website_url"] for ref in refs) == [URLS[0], URLS[2], URLS[3]]
+    for ref in refs:
+        assert load_team(ref["path"])["website_url"] == ref["website_url"]
+
+def test_collect_teams_resumes_from_the_cursor(tmp_path):
+    class InterruptedScraper(FakeScraper):
+        async def scrape_team(self, team_url: str) -> Team:
+            if team_url == URLS[3]:
+                raise asyncio.CancelledError()
+            return await super().scrape_team(team_url)
+
+    beats = []
+    try:
+        asyncio.run(_collect(InterruptedScraper(), tmp_path, 0, beats))
+    except asyncio.CancelledError:
+        pass
+    assert beats == [1, 2, 3]
+
+    scraper = FakeScraper()
+    refs = asyncio.run(_collect(scraper, tmp_path, beats[-1], []))
+
+    assert scraper.scraped == [URLS[3]]
+    assert sorted(ref["website_url"] for ref in refs) == [URLS[0], URLS[2], URLS[3]]
@@ -0,0 +1,42 @@
+from volleyball_aggregator.models.team import Coach, Player, Team, content_hash
+
+def _team(players, head_coach="Jane Doe", assistants=(), **fields):
+    return Team(
+        school_name=fields.pop("school_name", "University of Waterloo"),
+        division="CANADIAN",
+        head_coach=Coach(name=head_coach, title="Head Coach"),
+        assistant_coaches=[Coach(name=name, title="Assistant Coach") for name in assistants],
+        players=players,
+        website_url="https://athletics.uwaterloo.ca/sports/womens-volleyball/roster",
+        **fields
+    ).model_dump(mode="json")
+
+def test_duplicate_scrapes_hash_the_same():
+    players = [Player(name="Ana Silva", number="7"), Player(name="Bea Chen", number="12")]
+    first = _team(players)
+    second = _team(list(reversed(players)))
+
+    # Player order and last_updated differ between scrapes and are not changes
+    assert content_hash(first) == content_hash(second)
+
+def test_json_and_html_paths_hash_the_same():
+    from_json = _team(
+        [Player(name="Ana Silva", number="#7", position="Outside Hitter", height="5-11", year="Senior")],
+        assistants=["Sam Lee"]
+    )
+    from_html = _team(
+        [Player(name="  ana  silva ", number="7", position="OH", hometown="Waterloo, ON")],
+        head_coach="Sam Lee",
+        assistants=["JANE DOE"],
+        conference="OUA",
+        mascot="Warriors"
+    )
+
+    assert content_hash(from_json) == content_hash(from_html)
+
+def test_roster_changes_change_the_hash():
+    team = _team([Player(name="Ana Silva", number="7")])
+
+    assert content_hash(team) != content_hash(_team([Player(name="Ana Silva", number="8")]))
+    assert content_hash(team) != content_hash(_team([Player(name="Ana Silva", number="7"), Player(name="Bea Chen")]))
+    assert content_hash(team) != content_hash(_team([Player(name="Ana Silva", number="7")], head_coach="Sam Lee"))
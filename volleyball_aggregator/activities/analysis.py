@@ -3,17 +3,20 @@ import json
 import logging
 from datetime import datetime
 from temporalio import activity
-import openai
-from googleapiclient.discovery import build
 from ..config import settings
+from ..storage import load_team
 
 logger = logging.getLogger(__name__)
 
 @activity.defn
-async def analyze_team_data(team_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Analyze team data using OpenAI to generate insights."""
+async def analyze_team_data(team_ref: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze a scraped team, read from the file scrape_source wrote, using OpenAI to generate insights."""
+    # Imported here so workers that never run analysis don't pay for loading openai
+    import openai
+
     try:
-        client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        team_data = load_team(team_ref["path"])
+        client = openai.AsyncOpenAI(api_key=settings.require("OPENAI_API_KEY"))
         
         # Prepare the prompt
         prompt = f"""
@@ -51,10 +54,13 @@ async def analyze_team_data(team_data: Dict[str, Any]) -> Dict[str, Any]:
 @activity.defn
 async def store_in_sheets(analyzed_data: Dict[str, Any]) -> str:
     """Store the analyzed team data in Google Sheets."""
+    # Imported here so workers that never store to Sheets don't pay for loading the API client
+    from googleapiclient.discovery import build
+
     try:
         # Build the Sheets API service using API key
         service = build('sheets', 'v4', 
-                       developerKey=settings.GOOGLE_SHEETS_API_KEY.get_secret_value())
+                       developerKey=settings.require("GOOGLE_SHEETS_API_KEY"))
         spreadsheet = service.spreadsheets()
 
         # Prepare the data
@@ -105,7 +111,7 @@ async def store_in_sheets(analyzed_data: Dict[str, Any]) -> str:
             team_info.append([coach["name"], coach["title"]])
 
         # Update or create sheet
-        sheet_id = settings.GOOGLE_SHEET_ID
+        sheet_id = settings.require("GOOGLE_SHEET_ID")
         range_name = f"{team_data['school_name']}!A1"
         
         result = spreadsheet.values().update(
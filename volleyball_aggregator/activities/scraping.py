@@ -1,17 +1,23 @@
 import json
-from typing import Dict, Any, List
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
 from temporalio import activity
 import asyncio
-from ..models.team import Team
 from ..scrapers.base import BaseScraper
+from ..storage import load_team_refs, remove_teams, scraped_teams_dir, write_team
 from ..config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 @activity.defn
-async def scrape_source(source: Dict[str, str]) -> List[Dict[str, Any]]:
-    """Activity to scrape a specific source (NCAA D1, D3, or Canadian)."""
+async def scrape_source(source: Dict[str, str], skip_urls: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Activity to scrape a specific source (NCAA D1, D3, or Canadian), skipping the given team URLs.
+
+    Each team is written to its own file as it is scraped. Returns references
+    to those files, every team URL the source listed (skipped or not), and the
+    directory holding the files.
+    """
     logger.info(f"Starting scrape for {source['name']}")
     
     # Import the appropriate scraper based on the division
@@ -19,12 +25,46 @@ async def scrape_source(source: Dict[str, str]) -> List[Dict[str, Any]]:
     if not scraper_class:
         raise ValueError(f"No scraper implemented for division: {source['division']}")
 
+    # Retries of this activity share its directory, and Temporal keeps the last
+    # heartbeat (how many listed URLs were processed) across attempts and hosts
+    info = activity.info()
+    directory = scraped_teams_dir(f"{info.workflow_run_id}-{info.activity_id}")
+    start = info.heartbeat_details[0] if info.heartbeat_details else 0
+    if start:
+        logger.info(f"Resuming {source['name']} after {start} listed teams from the last attempt")
+    activity.heartbeat(start)
+
     # Initialize and run the scraper
     async with scraper_class(source['base_url']) as scraper:
-        teams = await scraper.scrape_all()
+        teams = await collect_teams(scraper, skip_urls, directory, start, activity.heartbeat)
         # Add a delay between batches as configured
         await asyncio.sleep(settings.SCRAPE_DELAY_SECONDS)
-        return [team.model_dump() for team in teams]
+        listed_urls = scraper.listed_urls
+
+    return {"teams": teams, "listed_urls": listed_urls, "directory": str(directory)}
+
+async def collect_teams(
+    scraper: BaseScraper,
+    skip_urls: Optional[List[str]],
+    directory: Path,
+    start: int,
+    heartbeat: Callable[[int], None]
+) -> List[Dict[str, Any]]:
+    """Write each newly scraped team to its own file, heartbeating the number of listed URLs processed.
+
+    Scraping resumes at index start of the team list, and the returned
+    references cover teams written by earlier attempts too.
+    """
+    processed = start
+
+    def on_progress(url: str, outcome: str) -> None:
+        nonlocal processed
+        processed += 1
+        heartbeat(processed)
+
+    async for team in scraper.iter_teams(skip_urls, on_progress=on_progress, start=start):
+        write_team(directory, team.model_dump(mode="json"))
+    return load_team_refs(directory, scraper.listed_urls)
 
 @activity.defn
 async def store_results(results: List[Dict[str, Any]]) -> None:
@@ -40,6 +80,12 @@ async def store_results(results: List[Dict[str, Any]]) -> None:
         logger.error(f"Error storing results: {str(e)}")
         raise
 
+@activity.defn
+async def remove_scraped_teams(directories: List[str]) -> None:
+    """Activity to delete the team files written by scrape_source."""
+    remove_teams(directories)
+    logger.info(f"Removed {len(directories)} scraped team directories")
+
 def _get_scraper_class(division: str) -> type[BaseScraper]:
     """Helper function to get the appropriate scraper class based on division."""
     # This would be replaced with actual scraper implementations
@@ -0,0 +1,178 @@
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import resource
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+async def compare_scrape_paths(division: str, base_url: str) -> None:
+    """Scrape every team of a source through both the JSON and HTML paths and print their cost."""
+    from .activities.scraping import _get_scraper_class
+
+    scraper_class = _get_scraper_class(division)
+    if not scraper_class:
+        raise ValueError(f"No scraper implemented for division: {division}")
+
+    async with scraper_class(base_url, keep_stats=True) as scraper:
+        for url in await scraper.get_team_list():
+            for path in ("json", "html"):
+                try:
+                    await scraper.scrape_team_measured(url, path)
+                except Exception as e:
+                    logger.error(f"Error scraping {url} via {path}: {str(e)}")
+
+        print(f"{'path':<6} {'bytes':>10} {'cpu (s)':>9} {'ok':>4}  url")
+        for stats in scraper.stats:
+            print(
+                f"{stats.path:<6} {stats.bytes_fetched:>10} {stats.cpu_seconds:>9.3f} "
+                f"{'yes' if stats.success else 'no':>4}  {stats.url}"
+            )
+
+# Modules only the analysis/storage activities need; importing the worker must not load them
+HEAVY_MODULES = ["openai", "googleapiclient"]
+
+def measure_import_time(module: str) -> Tuple[int, Dict[str, int]]:
+    """Import a module in a fresh interpreter under -X importtime.
+
+    Returns the module's cumulative import time and the cumulative time of
+    every module it pulled in, both in microseconds.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+
+    modules: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules.get(module, 0), modules
+
+def check_import_budget(modules: List[str], budget_ms: float) -> bool:
+    """Print import times and return whether every module stays within budget without heavy imports."""
+    ok = True
+    for module in modules:
+        total_us, imported = measure_import_time(module)
+        heavy = [name for name in HEAVY_MODULES if name in imported]
+        within_budget = total_us / 1000 <= budget_ms and not heavy
+        ok = ok and within_budget
+
+        print(f"{module}: {total_us / 1000:.1f} ms (budget {budget_ms:.0f} ms) {'ok' if within_budget else 'FAIL'}")
+        if heavy:
+            print(f"  eagerly imports {', '.join(heavy)}")
+        slowest = sorted(imported.items(), key=lambda item: item[1], reverse=True)[:5]
+        for name, cumulative in slowest:
+            print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+    return ok
+
+def _synthetic_roster_page(team: int, players: int = 30, filler_kb: int = 200) -> str:
+    """Build a Sidearm-style roster page, padded to roughly the size of a real one."""
+    roster = "".join(
+        f'<li class="sidearm-roster-player"><h3>Player {team}-{i}</h3>'
+        f'<span class="sidearm-roster-player-details">{i}</span>'
+        f'<span class="sidearm-roster-player-details">Position: OH</span>'
+        f'<span class="sidearm-roster-player-details">Hometown: Waterloo, ON</span></li>'
+        for i in range(players)
+    )
+    filler = '<div class="nav"><a href="#">link</a></div>' * (filler_kb * 1024 // 40)
+    return (
+        f'<html><body>{filler}<section class="sidearm-roster-players"><ul>{roster}</ul>'
+        f'</section></body></html>'
+    )
+
+async def _scrape_synthetic_teams(teams: int, mode: str) -> None:
+    """Scrape synthetic teams the way scrape_source does ("stream"), or the way it used to ("baseline").
+
+    The stream writes each team to a file in a temporary directory and keeps
+    only references. The baseline collects every Team before serializing them
+    all and never decomposes parse trees, leaving them to the cyclic GC.
+    """
+    import tempfile
+    from pathlib import Path
+    from .activities.scraping import collect_teams
+    from .scrapers.canadian import CanadianScraper
+
+    class SyntheticScraper(CanadianScraper):
+        DECOMPOSE_PARSE_TREES = mode != "baseline"
+
+        async def get_team_list(self) -> List[str]:
+            return [f"{self.WATERLOO_URL}?team={i}" for i in range(teams)]
+
+        def get_structured_url(self, team_url: str) -> None:
+            return None
+
+        async def _fetch_text(self, url: str) -> str:
+            return _synthetic_roster_page(int(url.rsplit('=', 1)[1]))
+
+    async with SyntheticScraper("") as scraper:
+        if mode == "baseline":
+            results = [team.model_dump() for team in await scraper.scrape_all()]
+        else:
+            with tempfile.TemporaryDirectory() as directory:
+                results = await collect_teams(scraper, None, Path(directory), 0, lambda processed: None)
+        logger.info(f"Held {len(results)} teams")
+
+def _peak_rss_kb(teams: int, mode: str) -> int:
+    asyncio.run(_scrape_synthetic_teams(teams, mode))
+    # ru_maxrss is in kilobytes on Linux (bytes on macOS)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def compare_peak_rss(team_counts: List[int]) -> None:
+    """Scrape growing numbers of synthetic teams in fresh processes and print peak RSS."""
+    context = multiprocessing.get_context("spawn")
+    print(f"{'teams':>6} {'baseline (MB)':>14} {'stream (MB)':>12}")
+    for teams in team_counts:
+        peaks = []
+        for mode in ("baseline", "stream"):
+            with context.Pool(1) as pool:
+                peaks.append(pool.apply(_peak_rss_kb, (teams, mode)))
+        print(f"{teams:>6} {peaks[0] / 1024:>14.1f} {peaks[1] / 1024:>12.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Volleyball aggregator benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scrape_parser = subparsers.add_parser("scrape", help="Compare JSON and HTML scrape paths per team")
+    scrape_parser.add_argument("--division", default="CANADIAN")
+    scrape_parser.add_argument("--base-url", default="https://usports.ca/en/sports/volleyball/f")
+
+    imports_parser = subparsers.add_parser("imports", help="Check import time against a budget")
+    imports_parser.add_argument(
+        "--module",
+        action="append",
+        help="Module to import (default: the worker and workflow modules)"
+    )
+    imports_parser.add_argument("--budget-ms", type=float, default=1000.0)
+
+    memory_parser = subparsers.add_parser("memory", help="Compare peak RSS of scrape_source's loop against the old one")
+    memory_parser.add_argument("--teams", type=int, nargs="+", default=[10, 50, 150])
+
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    if args.command == "scrape":
+        asyncio.run(compare_scrape_paths(args.division, args.base_url))
+    elif args.command == "imports":
+        modules = args.module or [
+            "volleyball_aggregator.worker",
+            "volleyball_aggregator.workflows.refresh"
+        ]
+        if not check_import_budget(modules, args.budget_ms):
+            sys.exit(1)
+    elif args.command == "memory":
+        compare_peak_rss(args.teams)
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,11 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
-load_dotenv()
-
 class Settings(BaseSettings):
     # Temporal Server Configuration
     TEMPORAL_HOST: str = "viaduct.proxy.rlwy.net"
@@ -18,19 +16,63 @@ class Settings(BaseSettings):
     def temporal_url(self) -> str:
         return f"{self.TEMPORAL_HOST}:{self.TEMPORAL_PORT}"
     
+    # Task queues per workload class
+    TASK_QUEUE_WORKFLOW: str = "volleyball-scraper"
+    TASK_QUEUE_SCRAPE: str = "volleyball-scrape"
+    TASK_QUEUE_ANALYZE: str = "volleyball-analyze"
+    TASK_QUEUE_STORE: str = "volleyball-store"
+
+    # Activity slots per worker process for each workload class
+    MAX_CONCURRENT_SCRAPE_ACTIVITIES: int = 20
+    MAX_CONCURRENT_ANALYZE_ACTIVITIES: int = 4
+    MAX_CONCURRENT_STORE_ACTIVITIES: int = 2
+
+    @property
+    def task_queues(self) -> Dict[str, str]:
+        return {
+            "workflow": self.TASK_QUEUE_WORKFLOW,
+            "scrape": self.TASK_QUEUE_SCRAPE,
+            "analyze": self.TASK_QUEUE_ANALYZE,
+            "store": self.TASK_QUEUE_STORE
+        }
+
+    @property
+    def max_concurrent_activities(self) -> Dict[str, int]:
+        return {
+            "scrape": self.MAX_CONCURRENT_SCRAPE_ACTIVITIES,
+            "analyze": self.MAX_CONCURRENT_ANALYZE_ACTIVITIES,
+            "store": self.MAX_CONCURRENT_STORE_ACTIVITIES
+        }
+    
     # Scraping Configuration
     SCRAPE_BATCH_SIZE: int = 10
     SCRAPE_DELAY_SECONDS: int = 5
+    # Processes per scrape worker that parse HTML off the event loop (0: a thread pool)
+    SCRAPE_PARSE_PROCESSES: int = 2
+    
+    # Refresh Configuration
+    REFRESH_INTERVAL_MINUTES: int = 360
+    REFRESH_MAX_BACKOFF_CYCLES: int = 8
+    REFRESH_PRUNE_AFTER_CYCLES: int = 4
     
     # Storage Configuration
     OUTPUT_DIR: str = "data"
     
-    # OpenAI Configuration
-    OPENAI_API_KEY: SecretStr
+    # OpenAI Configuration (only needed by analysis activities)
+    OPENAI_API_KEY: Optional[SecretStr] = None
+    
+    # Google Sheets Configuration (only needed by storage activities)
+    GOOGLE_SHEETS_API_KEY: Optional[SecretStr] = None
+    GOOGLE_SHEET_ID: Optional[str] = None
     
-    # Google Sheets Configuration
-    GOOGLE_SHEETS_API_KEY: SecretStr
-    GOOGLE_SHEET_ID: str
+    def require(self, name: str) -> str:
+        """Return a setting that is optional at startup but needed by the caller."""
+        value = getattr(self, name)
+        if value is None:
+            raise ValueError(f"{name} must be set")
+        if isinstance(value, SecretStr):
+            return value.get_secret_value()
+        return value
     
     @property
     def output_path(self) -> Path:
@@ -42,5 +84,17 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
+@lru_cache()
+def get_settings() -> Settings:
+    # Load environment variables from .env file if it exists
+    load_dotenv()
+    return Settings()
+
+class _LazySettings:
+    """Resolves Settings on first attribute access instead of at import time."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
 # Global settings instance
-settings = Settings() 
\ No newline at end of file
+settings = _LazySettings()
@@ -1,6 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 from datetime import datetime
+import hashlib
+import json
 
 class Player(BaseModel):
     name: str
@@ -44,4 +46,28 @@ class Team(BaseModel):
                     "career_record": "120-45"
                 }
             }
-        } 
\ No newline at end of file
+        } 
+
+def _identity(value: Optional[str]) -> str:
+    return " ".join((value or "").split()).casefold()
+
+def content_hash(team_data: Dict[str, Any]) -> str:
+    """Hash the identity of a team's roster: its players and coaching staff.
+
+    Only fields that read the same on every scrape path are included, so a
+    fallback from a source's JSON to its HTML page (or back) is not seen as a
+    change. Player details such as height or position, and coach titles and
+    order, are left out.
+    """
+    coaches = [team_data.get("head_coach") or {}, *(team_data.get("assistant_coaches") or [])]
+    identity = {
+        "school_name": _identity(team_data.get("school_name")),
+        "division": team_data.get("division"),
+        "players": sorted(
+            (_identity(player.get("name")), _identity(player.get("number")).lstrip("#"))
+            for player in team_data.get("players") or []
+        ),
+        "coaches": sorted({_identity(coach.get("name")) for coach in coaches} - {""})
+    }
+    encoded = json.dumps(identity, sort_keys=True)
+    return hashlib.sha256(encoded.encode()).hexdigest()
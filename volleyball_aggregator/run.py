@@ -1,31 +1,68 @@
+import argparse
 import asyncio
 import logging
 from datetime import timedelta
 from temporalio.client import Client
 from .workflows.aggregator import DataAggregatorWorkflow
+from .workflows.refresh import RefreshWorkflow
 from .config import settings
 
 async def main():
+    parser = argparse.ArgumentParser(description="Start the volleyball aggregator workflow")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Start the incremental refresh loop instead of a one-off full crawl"
+    )
+    args = parser.parse_args()
+
     # Initialize the client with configured server
     client = await Client.connect(settings.temporal_url)
 
+    if args.refresh:
+        await start_refresh(client)
+        return
+
     # Start the workflow
     handle = await client.start_workflow(
         DataAggregatorWorkflow.run,
+        settings.task_queues,
         id="volleyball-scraper",
-        task_queue="volleyball-scraper",
+        task_queue=settings.TASK_QUEUE_WORKFLOW,
         execution_timeout=timedelta(hours=2)
     )
 
     logging.info(f"Started workflow with ID {handle.id} on server {settings.temporal_url}")
-    
+
     # Wait for the result
     result = await handle.result()
     logging.info(f"Workflow completed with {len(result)} teams scraped")
 
+async def start_refresh(client: Client):
+    # The refresh loop runs until cancelled, so don't wait for a result
+    handle = await client.start_workflow(
+        RefreshWorkflow.run,
+        args=[
+            None,
+            settings.task_queues,
+            {
+                "interval_seconds": settings.REFRESH_INTERVAL_MINUTES * 60,
+                "max_backoff_cycles": settings.REFRESH_MAX_BACKOFF_CYCLES,
+                "prune_after_cycles": settings.REFRESH_PRUNE_AFTER_CYCLES
+            }
+        ],
+        id="volleyball-refresh",
+        task_queue=settings.TASK_QUEUE_WORKFLOW
+    )
+
+    logging.info(
+        f"Started refresh workflow with ID {handle.id} on server {settings.temporal_url}; "
+        f"query 'last_cycle' for refreshed vs. skipped counts"
+    )
+
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main())
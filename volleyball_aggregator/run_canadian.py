@@ -5,6 +5,11 @@ from temporalio.common import RetryPolicy
 from .config import settings
 
 async def main():
+    """Scrape Canadian teams without analysis or storage.
+
+    This is the entry point for scrape-only deployments (worker --profile scrape-only),
+    which run ScrapeSourceWorkflow but none of the workflows that need analyze or store workers.
+    """
     # Create client connected to server
     client = await Client.connect(settings.temporal_url)
 
@@ -18,9 +23,9 @@ async def main():
     # Execute the workflow
     handle = await client.start_workflow(
         "ScrapeSourceWorkflow",
-        source,
+        args=[source, settings.task_queues],
         id="scrape-canadian",
-        task_queue="volleyball-tasks",
+        task_queue=settings.TASK_QUEUE_WORKFLOW,
         retry_policy=RetryPolicy(
             initial_interval=timedelta(seconds=1),
             maximum_interval=timedelta(minutes=10),
@@ -34,7 +39,8 @@ async def main():
     # Wait for the workflow to complete
     result = await handle.result()
     print("Workflow completed!")
-    print(f"Number of teams scraped: {len(result)}")
+    print(f"Number of teams scraped: {len(result['teams'])}")
+    print(f"Team files written to: {result['directory']}")
     return result
 
 if __name__ == "__main__":
@@ -1,19 +1,67 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, TypeVar
+from pydantic import BaseModel
 from ..models.team import Team
 import aiohttp
 from bs4 import BeautifulSoup
+import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Executor that parses HTML off the event loop; None means asyncio's default thread pool
+_parse_executor: Optional[Executor] = None
+
+def set_parse_executor(executor: Optional[Executor]) -> None:
+    """Parse pages in the given executor, e.g. a process pool so CPU-bound parsing
+    does not compete with fetches and heartbeats on the event loop."""
+    global _parse_executor
+    _parse_executor = executor
+
+def _parse_html(extract: Callable[[BeautifulSoup, str], T], html: str, url: str, decompose: bool) -> T:
+    """Parse a page and extract data from it; runs inside the parse executor."""
+    soup = BeautifulSoup(html, 'html.parser')
+    try:
+        return extract(soup, url)
+    finally:
+        if decompose:
+            # Release the parse tree now instead of leaving it to the cyclic GC
+            soup.decompose()
+
+class TeamScrapeStats(BaseModel):
+    """Cost of scraping a single team through one path ("json" or "html").
+
+    bytes_fetched is the size on the wire (Content-Length) when the server
+    sends one, and the decoded body size otherwise. cpu_seconds covers this
+    process only, so it excludes parsing done in a process pool.
+    """
+    url: str
+    path: str
+    bytes_fetched: int = 0
+    cpu_seconds: float = 0.0
+    success: bool = False
+
 class BaseScraper(ABC):
-    def __init__(self, base_url: str):
+    # Bound every request well below the scrape activity's heartbeat timeout;
+    # a team can take two requests (JSON, then the HTML fallback)
+    REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=60)
+    DECOMPOSE_PARSE_TREES = True
+
+    def __init__(self, base_url: str, keep_stats: bool = False):
         self.base_url = base_url
         self._session: Optional[aiohttp.ClientSession] = None
+        self._bytes_fetched = 0
+        # Per-team stats are logged as they are recorded; only benchmarks keep them
+        self.keep_stats = keep_stats
+        self.stats: List[TeamScrapeStats] = []
+        self.listed_urls: List[str] = []
 
     async def __aenter__(self):
-        self._session = aiohttp.ClientSession()
+        self._session = aiohttp.ClientSession(timeout=self.REQUEST_TIMEOUT)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -30,34 +78,158 @@ class BaseScraper(ABC):
         """Scrape a single team's information."""
         pass
 
-    async def scrape_all(self) -> List[Team]:
-        """Scrape all teams from this source."""
-        teams = []
+    def get_structured_url(self, team_url: str) -> Optional[str]:
+        """Return the URL of a JSON representation of the team, if the source has one."""
+        return None
+
+    def parse_structured(self, data: Any, team_url: str) -> Optional[Team]:
+        """Map a JSON payload from get_structured_url to a Team, or None if it is unusable."""
+        return None
+
+    async def scrape_team_structured(self, team_url: str) -> Optional[Team]:
+        """Scrape a team from its JSON representation, without any HTML parsing."""
+        structured_url = self.get_structured_url(team_url)
+        if not structured_url:
+            return None
+
+        data = await self._fetch_json(structured_url)
+        if data is None:
+            return None
+
+        try:
+            return self.parse_structured(data, team_url)
+        except Exception as e:
+            logger.error(f"Error parsing structured data for {team_url}: {str(e)}")
+            return None
+
+    async def scrape_team_measured(self, team_url: str, path: str) -> Optional[Team]:
+        """Scrape a team through the given path ("json" or "html") and log its cost.
+
+        The stats are also appended to self.stats when keep_stats is set.
+
+        CPU time is process-wide, so it is only attributable to this team when
+        nothing else runs on the event loop concurrently.
+        """
+        stats = TeamScrapeStats(url=team_url, path=path)
+        bytes_before = self._bytes_fetched
+        cpu_before = time.process_time()
+        team = None
         try:
-            team_urls = await self.get_team_list()
-            for url in team_urls:
+            if path == "json":
+                team = await self.scrape_team_structured(team_url)
+            else:
+                team = await self.scrape_team(team_url)
+            return team
+        finally:
+            stats.bytes_fetched = self._bytes_fetched - bytes_before
+            stats.cpu_seconds = time.process_time() - cpu_before
+            stats.success = team is not None
+            logger.info(
+                f"Scraped {stats.url} via {stats.path}: {stats.bytes_fetched} bytes, "
+                f"{stats.cpu_seconds:.3f}s CPU, {'ok' if stats.success else 'failed'}"
+            )
+            if self.keep_stats:
+                self.stats.append(stats)
+
+    async def scrape_team_preferring_structured(self, team_url: str) -> Team:
+        """Scrape a team from its JSON representation, falling back to the HTML page."""
+        if self.get_structured_url(team_url):
+            team = await self.scrape_team_measured(team_url, "json")
+            if team:
+                return team
+            logger.info(f"No usable structured data for {team_url}, falling back to HTML")
+
+        return await self.scrape_team_measured(team_url, "html")
+
+    async def iter_teams(
+        self,
+        skip_urls: Optional[Iterable[str]] = None,
+        on_progress: Optional[Callable[[str, str], None]] = None,
+        start: int = 0
+    ) -> AsyncIterator[Team]:
+        """Scrape teams from this source one at a time, except those listed in skip_urls.
+
+        Each team is yielded as soon as it is scraped, so callers can process
+        and drop it before the next page is fetched. The full team list,
+        including skipped URLs, is kept in self.listed_urls. on_progress is
+        called with each listed URL and its outcome ("skipped", "failed" or
+        "scraped"), after the team has been yielded. Scraping resumes at index
+        start of the team list; earlier URLs are neither scraped nor reported.
+
+        Errors getting the team list propagate, so a failed listing is never
+        mistaken for a source that lists no teams.
+        """
+        skip = set(skip_urls or [])
+        self.listed_urls = await self.get_team_list()
+
+        for url in self.listed_urls[start:]:
+            if url in skip:
+                outcome = "skipped"
+            else:
                 try:
-                    team = await self.scrape_team(url)
-                    teams.append(team)
+                    team = await self.scrape_team_preferring_structured(url)
                 except Exception as e:
                     logger.error(f"Error scraping team {url}: {str(e)}")
-        except Exception as e:
-            logger.error(f"Error getting team list: {str(e)}")
-        return teams
+                    outcome = "failed"
+                else:
+                    yield team
+                    outcome = "scraped"
+            if on_progress:
+                on_progress(url, outcome)
 
-    async def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Helper method to fetch and parse a page."""
+    async def scrape_all(self, skip_urls: Optional[Iterable[str]] = None) -> List[Team]:
+        """Scrape all teams from this source, except those listed in skip_urls."""
+        return [team async for team in self.iter_teams(skip_urls)]
+
+    async def _fetch(self, url: str, **kwargs) -> Optional[aiohttp.ClientResponse]:
+        """Helper method to fetch a URL, counting the bytes received (see TeamScrapeStats)."""
         if not self._session:
             raise RuntimeError("Scraper must be used as an async context manager")
-        
+
         try:
-            async with self._session.get(url) as response:
+            async with self._session.get(url, **kwargs) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    return BeautifulSoup(html, 'html.parser')
+                    body = await response.read()
+                    # Prefer the wire size; read() returns the decompressed body
+                    self._bytes_fetched += response.content_length or len(body)
+                    return response
                 else:
                     logger.error(f"Failed to fetch {url}: Status {response.status}")
                     return None
         except Exception as e:
             logger.error(f"Error fetching {url}: {str(e)}")
-            return None 
\ No newline at end of file
+            return None
+
+    async def _fetch_text(self, url: str) -> Optional[str]:
+        """Helper method to fetch a page's HTML."""
+        response = await self._fetch(url)
+        if response is None:
+            return None
+        return await response.text()
+
+    async def _parse_page(self, url: str, extract: Callable[[BeautifulSoup, str], T]) -> Optional[T]:
+        """Helper method to fetch a page and run extract(soup, url) on it in the parse executor.
+
+        extract must be a module-level function so it can be sent to a process pool.
+        Returns None if the page could not be fetched.
+        """
+        html = await self._fetch_text(url)
+        if html is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _parse_executor, _parse_html, extract, html, url, self.DECOMPOSE_PARSE_TREES
+        )
+
+    async def _fetch_json(self, url: str) -> Optional[Any]:
+        """Helper method to fetch a JSON document."""
+        response = await self._fetch(url, headers={'Accept': 'application/json'})
+        if response is None:
+            return None
+
+        try:
+            return await response.json(content_type=None)
+        except Exception as e:
+            logger.error(f"Invalid JSON from {url}: {str(e)}")
+            return None
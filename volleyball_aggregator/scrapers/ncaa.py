@@ -9,77 +9,81 @@ logger = logging.getLogger(__name__)
 class NCAADivisionScraper(BaseScraper):
     async def get_team_list(self) -> List[str]:
         """Get a list of team URLs to scrape."""
-        soup = await self._fetch_page(self.base_url)
-        if not soup:
-            return []
-
-        # This is a placeholder implementation
-        # You would need to implement the actual logic to find team links
-        team_links = soup.find_all('a', href=True)
-        return [
-            link['href'] for link in team_links 
-            if 'volleyball' in link['href'].lower() 
-            and 'roster' in link['href'].lower()
-        ]
+        team_urls = await self._parse_page(self.base_url, _extract_team_urls)
+        if team_urls is None:
+            raise ValueError(f"Failed to fetch team list: {self.base_url}")
+        return team_urls
 
     async def scrape_team(self, team_url: str) -> Team:
         """Scrape a single team's information."""
-        soup = await self._fetch_page(team_url)
-        if not soup:
+        team = await self._parse_page(team_url, _extract_team)
+        if not team:
             raise ValueError(f"Failed to fetch team page: {team_url}")
+        return team
+
+# Extraction runs in the parse executor, so it lives in module-level functions
 
-        # This is a placeholder implementation
-        # You would need to implement the actual parsing logic
-        team_data = {
-            'school_name': self._extract_school_name(soup),
-            'division': self._extract_division(soup),
-            'conference': self._extract_conference(soup),
-            'head_coach': self._extract_head_coach(soup),
-            'players': self._extract_players(soup),
-            'website_url': team_url
-        }
+def _extract_team_urls(soup: BeautifulSoup, url: str) -> List[str]:
+    # This is a placeholder implementation
+    # You would need to implement the actual logic to find team links
+    team_links = soup.find_all('a', href=True)
+    return [
+        link['href'] for link in team_links 
+        if 'volleyball' in link['href'].lower() 
+        and 'roster' in link['href'].lower()
+    ]
 
-        return Team(**team_data)
+def _extract_team(soup: BeautifulSoup, team_url: str) -> Team:
+    # This is a placeholder implementation
+    # You would need to implement the actual parsing logic
+    return Team(
+        school_name=_extract_school_name(soup),
+        division=_extract_division(soup),
+        conference=_extract_conference(soup),
+        head_coach=_extract_head_coach(soup),
+        players=_extract_players(soup),
+        website_url=team_url
+    )
 
-    def _extract_school_name(self, soup: BeautifulSoup) -> str:
-        # Implement actual extraction logic
-        title = soup.find('title')
-        return title.text if title else "Unknown School"
+def _extract_school_name(soup: BeautifulSoup) -> str:
+    # Implement actual extraction logic
+    title = soup.find('title')
+    return title.text if title else "Unknown School"
 
-    def _extract_division(self, soup: BeautifulSoup) -> str:
-        # This would be passed in from the source configuration
-        return "NCAA_D1"
+def _extract_division(soup: BeautifulSoup) -> str:
+    # This would be passed in from the source configuration
+    return "NCAA_D1"
 
-    def _extract_conference(self, soup: BeautifulSoup) -> Optional[str]:
-        # Implement actual extraction logic
-        conf_elem = soup.find('div', {'class': 'conference'})
-        return conf_elem.text if conf_elem else None
+def _extract_conference(soup: BeautifulSoup) -> Optional[str]:
+    # Implement actual extraction logic
+    conf_elem = soup.find('div', {'class': 'conference'})
+    return conf_elem.text if conf_elem else None
 
-    def _extract_head_coach(self, soup: BeautifulSoup) -> Optional[Coach]:
-        # Implement actual extraction logic
-        coach_elem = soup.find('div', {'class': 'coach'})
-        if not coach_elem:
-            return None
+def _extract_head_coach(soup: BeautifulSoup) -> Optional[Coach]:
+    # Implement actual extraction logic
+    coach_elem = soup.find('div', {'class': 'coach'})
+    if not coach_elem:
+        return None
 
-        return Coach(
-            name=coach_elem.get_text(),
-            title="Head Coach"
-        )
+    return Coach(
+        name=coach_elem.get_text(),
+        title="Head Coach"
+    )
 
-    def _extract_players(self, soup: BeautifulSoup) -> List[Player]:
-        # Implement actual extraction logic
-        players = []
-        roster_table = soup.find('table', {'class': 'roster'})
-        if not roster_table:
-            return players
+def _extract_players(soup: BeautifulSoup) -> List[Player]:
+    # Implement actual extraction logic
+    players = []
+    roster_table = soup.find('table', {'class': 'roster'})
+    if not roster_table:
+        return players
 
-        for row in roster_table.find_all('tr')[1:]:  # Skip header row
-            cols = row.find_all('td')
-            if len(cols) >= 3:
-                players.append(Player(
-                    name=cols[0].get_text().strip(),
-                    number=cols[1].get_text().strip(),
-                    position=cols[2].get_text().strip()
-                ))
+    for row in roster_table.find_all('tr')[1:]:  # Skip header row
+        cols = row.find_all('td')
+        if len(cols) >= 3:
+            players.append(Player(
+                name=cols[0].get_text().strip(),
+                number=cols[1].get_text().strip(),
+                position=cols[2].get_text().strip()
+            ))
 
-        return players 
\ No newline at end of file
+    return players
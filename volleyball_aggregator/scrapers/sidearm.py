@@ -0,0 +1,79 @@
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+from .base import BaseScraper
+from ..models.team import Coach, Player
+
+logger = logging.getLogger(__name__)
+
+class SidearmScraper(BaseScraper):
+    """Base for Sidearm-hosted athletics sites, which serve rosters as JSON.
+
+    A roster page at ``/sports/<sport>/roster`` has a JSON counterpart at
+    ``/api/v2/Rosters/bySport/<sport>``, a fraction of the HTML size.
+    """
+    ROSTER_API_PATH = "/api/v2/Rosters/bySport/{sport}"
+
+    def get_structured_url(self, team_url: str) -> Optional[str]:
+        """Map a Sidearm roster page URL to its roster API URL."""
+        parsed = urlparse(team_url)
+        parts = [part for part in parsed.path.split('/') if part]
+        if len(parts) < 3 or parts[0] != 'sports' or parts[2] != 'roster':
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}{self.ROSTER_API_PATH.format(sport=parts[1])}"
+
+    def _parse_sidearm_roster(self, data: Any) -> Optional[Tuple[List[Player], List[Coach]]]:
+        """Extract players and coaches from a Sidearm roster payload."""
+        if isinstance(data, dict) and isinstance(data.get('roster'), dict):
+            data = data['roster']
+        if not isinstance(data, dict) or not isinstance(data.get('players'), list):
+            return None
+
+        players = []
+        for entry in data['players']:
+            player = self._extract_sidearm_player(entry)
+            if player:
+                players.append(player)
+
+        coaches = []
+        for entry in data.get('coaches') or []:
+            coach = self._extract_sidearm_coach(entry)
+            if coach:
+                coaches.append(coach)
+
+        if not players:
+            return None
+        return players, coaches
+
+    def _extract_sidearm_player(self, entry: Dict[str, Any]) -> Optional[Player]:
+        """Map a Sidearm roster player entry to a Player."""
+        name = _full_name(entry)
+        if not name:
+            return None
+
+        height = ""
+        if entry.get('heightFeet') is not None:
+            height = f"{entry['heightFeet']}-{entry.get('heightInches') or 0}"
+
+        return Player(
+            name=name,
+            number=_text(entry.get('jerseyNumber')),
+            position=_text(entry.get('positionLong') or entry.get('positionShort')),
+            year=_text(entry.get('academicYearLong') or entry.get('academicYearShort')),
+            hometown=_text(entry.get('hometown')),
+            height=height
+        )
+
+    def _extract_sidearm_coach(self, entry: Dict[str, Any]) -> Optional[Coach]:
+        """Map a Sidearm roster coach entry to a Coach."""
+        name = _full_name(entry)
+        title = _text(entry.get('title'))
+        if not name or not title:
+            return None
+        return Coach(name=name, title=title)
+
+def _text(value: Any) -> str:
+    return str(value).strip() if value is not None else ""
+
+def _full_name(entry: Dict[str, Any]) -> str:
+    return f"{_text(entry.get('firstName'))} {_text(entry.get('lastName'))}".strip()
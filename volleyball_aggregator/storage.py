@@ -0,0 +1,57 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+from .config import settings
+from .models.team import content_hash
+
+# Scraped teams are written one file per team and passed between activities
+# by reference, so no activity payload or heartbeat carries a whole source.
+# OUTPUT_DIR must be shared by the scrape, analyze and store workers.
+
+def scraped_teams_dir(name: str) -> Path:
+    """Directory holding the teams scraped by one scrape activity."""
+    directory = settings.output_path / "scraped" / name
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+def write_team(directory: Path, team_data: Dict[str, Any]) -> Path:
+    """Write a serialized team to its own file, atomically replacing an earlier copy."""
+    key = team_data.get("website_url") or team_data["school_name"]
+    path = directory / f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.json"
+    partial = path.with_suffix(".json.tmp")
+    with open(partial, 'w') as f:
+        json.dump(team_data, f)
+    os.replace(partial, path)
+    return path
+
+def load_team(path: str) -> Dict[str, Any]:
+    """Read a team written by write_team."""
+    with open(path) as f:
+        return json.load(f)
+
+def load_team_refs(directory: Path, listed_urls: Iterable[str]) -> List[Dict[str, Any]]:
+    """Summarize the teams in a directory that their source still lists.
+
+    Files are read one at a time, so only the small references are kept.
+    """
+    listed = set(listed_urls)
+    refs = []
+    for path in sorted(directory.glob("*.json")):
+        team_data = load_team(str(path))
+        if team_data.get("website_url") and team_data["website_url"] not in listed:
+            continue
+        refs.append({
+            "website_url": team_data.get("website_url"),
+            "school_name": team_data["school_name"],
+            "content_hash": content_hash(team_data),
+            "path": str(path)
+        })
+    return refs
+
+def remove_teams(directories: Iterable[str]) -> None:
+    """Delete directories of scraped teams once they have been processed."""
+    for directory in directories:
+        shutil.rmtree(directory, ignore_errors=True)
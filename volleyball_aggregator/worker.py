@@ -1,38 +1,158 @@
+import argparse
 import asyncio
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
 from temporalio.client import Client
 from temporalio.worker import Worker
-from .workflows.aggregator import DataAggregatorWorkflow, ScrapeSourceWorkflow
-from .activities.scraping import scrape_source, store_results
-from .activities.analysis import analyze_team_data, store_in_sheets
+from .workflows.aggregator import WORKLOADS, DataAggregatorWorkflow, ScrapeSourceWorkflow
+from .workflows.refresh import RefreshWorkflow
 from .config import settings
 
-async def run_worker():
-    # Initialize the client with configured server
-    client = await Client.connect(settings.temporal_url)
+# Named sets of workloads and the workflows their workflow worker runs. Scrape-only
+# workers never load the OpenAI or Sheets activities, and only run ScrapeSourceWorkflow
+# (started by run_canadian.py), since the other workflows need analyze and store workers
+PROFILES = {
+    "all": {
+        "workloads": WORKLOADS,
+        "workflows": [DataAggregatorWorkflow, ScrapeSourceWorkflow, RefreshWorkflow]
+    },
+    "scrape-only": {
+        "workloads": ["workflow", "scrape"],
+        "workflows": [ScrapeSourceWorkflow]
+    }
+}
+
+def _load_activities(workload: str) -> List[Callable]:
+    """Import the activities served by a workload class, so workers only load what they run."""
+    if workload == "scrape":
+        from .activities.scraping import scrape_source
+        return [scrape_source]
+    if workload == "analyze":
+        from .activities.analysis import analyze_team_data
+        return [analyze_team_data]
+    if workload == "store":
+        from .activities.scraping import remove_scraped_teams, store_results
+        from .activities.analysis import store_in_sheets
+        return [store_results, store_in_sheets, remove_scraped_teams]
+    raise ValueError(f"Unknown workload: {workload}")
 
-    # Run the worker
-    worker = Worker(
+def _build_worker(client: Client, workload: str, profile: str) -> Worker:
+    """Create a worker polling the task queue of one workload class."""
+    task_queue = settings.task_queues[workload]
+    if workload == "workflow":
+        return Worker(
+            client,
+            task_queue=task_queue,
+            workflows=PROFILES[profile]["workflows"]
+        )
+
+    return Worker(
         client,
-        task_queue="volleyball-scraper",
-        workflows=[DataAggregatorWorkflow, ScrapeSourceWorkflow],
-        activities=[
-            scrape_source,
-            store_results,
-            analyze_team_data,
-            store_in_sheets
-        ]
+        task_queue=task_queue,
+        activities=_load_activities(workload),
+        max_concurrent_activities=settings.max_concurrent_activities[workload]
     )
 
-    logging.info(f"Starting worker... Connected to Temporal server at {settings.temporal_url}")
-    await worker.run()
+async def run_worker(workloads: List[str] = WORKLOADS, profile: str = "all"):
+    # Initialize the client with configured server
+    client = await Client.connect(settings.temporal_url)
 
-def main():
+    # Run one worker per workload class in this process
+    workers = [_build_worker(client, workload, profile) for workload in workloads]
+
+    parse_executor = None
+    if "scrape" in workloads and settings.SCRAPE_PARSE_PROCESSES > 0:
+        from .scrapers.base import set_parse_executor
+        # Spawn rather than fork: this process already runs Temporal's threads
+        parse_executor = ProcessPoolExecutor(
+            settings.SCRAPE_PARSE_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        set_parse_executor(parse_executor)
+
+    logging.info(
+        f"Starting worker for {', '.join(workloads)}... "
+        f"Connected to Temporal server at {settings.temporal_url}"
+    )
+    try:
+        await asyncio.gather(*(worker.run() for worker in workers))
+    finally:
+        if parse_executor:
+            parse_executor.shutdown()
+
+def _run_process(workloads: List[str], profile: str):
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        format='%(asctime)s - %(process)d - %(name)s - %(levelname)s - %(message)s'
     )
-    asyncio.run(run_worker())
+    asyncio.run(run_worker(workloads, profile))
+
+def _parse_workload(value: str) -> Tuple[str, Optional[int]]:
+    """Parse a --workload value, e.g. "scrape" or "scrape=4", into a workload class and process count."""
+    workload, _, count = value.partition("=")
+    if workload not in WORKLOADS:
+        raise argparse.ArgumentTypeError(
+            f"invalid workload: {workload} (choose from {', '.join(WORKLOADS)})"
+        )
+    if not count:
+        return workload, None
+    if not count.isdigit() or int(count) < 1:
+        raise argparse.ArgumentTypeError(f"invalid process count for {workload}: {count}")
+    return workload, int(count)
+
+def _plan_processes(workloads: List[Tuple[str, Optional[int]]]) -> List[List[str]]:
+    """Group workloads into worker processes.
+
+    Workloads given a count get that many processes of their own; the rest
+    share a single process.
+    """
+    shared = [workload for workload, count in workloads if count is None]
+    plan = [shared] if shared else []
+    for workload, count in workloads:
+        if count is not None:
+            plan.extend([workload] for _ in range(count))
+    return plan
+
+def main():
+    parser = argparse.ArgumentParser(description="Run volleyball aggregator Temporal workers")
+    parser.add_argument(
+        "--workload",
+        action="append",
+        type=_parse_workload,
+        metavar="WORKLOAD[=PROCESSES]",
+        help=(
+            f"Workload class to serve ({', '.join(WORKLOADS)}), optionally with a number of "
+            f"dedicated processes; repeat for several (overrides --profile)"
+        )
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILES,
+        default="all",
+        help=(
+            "Named set of workload classes to serve in one process; with --workload, "
+            "selects the workflows a workflow worker runs"
+        )
+    )
+    args = parser.parse_args()
+    plan = _plan_processes(
+        args.workload or [(workload, None) for workload in PROFILES[args.profile]["workloads"]]
+    )
+
+    if len(plan) == 1:
+        _run_process(plan[0], args.profile)
+        return
+
+    processes = [
+        multiprocessing.Process(target=_run_process, args=(workloads, args.profile))
+        for workloads in plan
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,40 +1,60 @@
 from datetime import timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import asyncio
 from temporalio import workflow
 from temporalio.common import RetryPolicy
-from ..models.team import Team
+from temporalio.exceptions import ApplicationError
+
+WORKLOADS = ["workflow", "scrape", "analyze", "store"]
+
+def check_task_queues(task_queues: Dict[str, str]) -> None:
+    """Fail the workflow if a workload class has no task queue.
+
+    Queue names come only from the starter (settings.task_queues), so the
+    workflow never falls back to names no worker is polling.
+    """
+    missing = [workload for workload in WORKLOADS if not task_queues.get(workload)]
+    if missing:
+        raise ApplicationError(f"Missing task queues for: {', '.join(missing)}", non_retryable=True)
+
+# How long analyze and store activities wait for a worker before failing, so
+# a deployment without those workloads fails them instead of waiting forever
+SCHEDULE_TO_START_TIMEOUT = timedelta(minutes=10)
+
+SOURCES = [
+    {
+        "name": "NCAA Division I",
+        "division": "NCAA_D1",
+        "base_url": "https://www.ncaa.com/schools"
+    },
+    {
+        "name": "NCAA Division III",
+        "division": "NCAA_D3",
+        "base_url": "https://www.ncaa.com/schools"
+    },
+    {
+        "name": "Canadian Universities",
+        "division": "CANADIAN",
+        "base_url": "https://usports.ca/en/sports/volleyball/f"
+    }
+]
 
 @workflow.defn
 class DataAggregatorWorkflow:
     @workflow.run
-    async def run(self) -> List[Dict[str, Any]]:
-        sources = [
-            {
-                "name": "NCAA Division I",
-                "division": "NCAA_D1",
-                "base_url": "https://www.ncaa.com/schools"
-            },
-            {
-                "name": "NCAA Division III",
-                "division": "NCAA_D3",
-                "base_url": "https://www.ncaa.com/schools"
-            },
-            {
-                "name": "Canadian Universities",
-                "division": "CANADIAN",
-                "base_url": "https://usports.ca/en/sports/volleyball/f"
-            }
-        ]
-
-        # Create child workflows for each source
+    async def run(self, task_queues: Dict[str, str]) -> List[Dict[str, Any]]:
+        check_task_queues(task_queues)
+
+        # Create child workflows for each source; they return references to team files
         results = []
-        for source in sources:
+        directories = []
+        for source in SOURCES:
             try:
                 result = await workflow.execute_child_workflow(
                     "ScrapeSourceWorkflow",
-                    source,
+                    args=[source, task_queues],
                     id=f"scrape-{source['division'].lower()}",
+                    task_queue=task_queues["workflow"],
                     retry_policy=RetryPolicy(
                         initial_interval=timedelta(seconds=1),
                         maximum_interval=timedelta(minutes=10),
@@ -42,7 +62,8 @@ class DataAggregatorWorkflow:
                         non_retryable_error_types=["ValueError"]
                     )
                 )
-                results.extend(result)
+                results.extend(result["teams"])
+                directories.append(result["directory"])
             except Exception as e:
                 workflow.logger.error(f"Error in child workflow for {source['name']}: {str(e)}")
 
@@ -50,35 +71,7 @@ class DataAggregatorWorkflow:
         analyzed_results = []
         for team_data in results:
             try:
-                # AI Analysis
-                analysis = await workflow.execute_activity(
-                    "analyze_team_data",
-                    team_data,
-                    start_to_close_timeout=timedelta(minutes=5),
-                    retry_policy=RetryPolicy(
-                        initial_interval=timedelta(seconds=1),
-                        maximum_interval=timedelta(minutes=5),
-                        maximum_attempts=3
-                    )
-                )
-                
-                # Store in Google Sheets
-                sheet_result = await workflow.execute_activity(
-                    "store_in_sheets",
-                    analysis,
-                    start_to_close_timeout=timedelta(minutes=5),
-                    retry_policy=RetryPolicy(
-                        initial_interval=timedelta(seconds=1),
-                        maximum_interval=timedelta(minutes=5),
-                        maximum_attempts=3
-                    )
-                )
-                
-                analyzed_results.append({
-                    "team_data": team_data,
-                    "analysis": analysis,
-                    "storage_result": sheet_result
-                })
+                analyzed_results.append(await analyze_and_store_team(team_data, task_queues))
             except Exception as e:
                 workflow.logger.error(f"Error processing team {team_data.get('school_name')}: {str(e)}")
 
@@ -87,23 +80,36 @@ class DataAggregatorWorkflow:
             await workflow.execute_activity(
                 "store_results",
                 analyzed_results,
+                task_queue=task_queues["store"],
+                schedule_to_start_timeout=SCHEDULE_TO_START_TIMEOUT,
                 start_to_close_timeout=timedelta(minutes=5)
             )
 
+        await remove_scraped_teams(directories, task_queues)
+
         return analyzed_results
 
 @workflow.defn
 class ScrapeSourceWorkflow:
     @workflow.run
-    async def run(self, source: Dict[str, str]) -> List[Dict[str, Any]]:
+    async def run(
+        self,
+        source: Dict[str, str],
+        task_queues: Dict[str, str],
+        skip_urls: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        check_task_queues(task_queues)
+
         # Add a small delay to prevent overwhelming the sources
         await asyncio.sleep(5)
 
         # Execute the scraping activity
-        teams = await workflow.execute_activity(
+        result = await workflow.execute_activity(
             "scrape_source",
-            source,
+            args=[source, skip_urls],
+            task_queue=task_queues["scrape"],
             start_to_close_timeout=timedelta(minutes=30),
+            heartbeat_timeout=timedelta(minutes=5),
             retry_policy=RetryPolicy(
                 initial_interval=timedelta(seconds=1),
                 maximum_interval=timedelta(minutes=10),
@@ -111,4 +117,51 @@ class ScrapeSourceWorkflow:
             )
         )
 
-        return teams 
\ No newline at end of file
+        return result
+
+async def remove_scraped_teams(directories: List[str], task_queues: Dict[str, str]) -> None:
+    """Delete the team files written by scrape_source once a workflow is done with them."""
+    if directories:
+        await workflow.execute_activity(
+            "remove_scraped_teams",
+            directories,
+            task_queue=task_queues["store"],
+            schedule_to_start_timeout=SCHEDULE_TO_START_TIMEOUT,
+            start_to_close_timeout=timedelta(minutes=5)
+        )
+
+async def analyze_and_store_team(team_data: Dict[str, Any], task_queues: Dict[str, str]) -> Dict[str, Any]:
+    """Run AI analysis for one scraped team (a reference to its file) and store it in Google Sheets."""
+    # AI Analysis
+    analysis = await workflow.execute_activity(
+        "analyze_team_data",
+        team_data,
+        task_queue=task_queues["analyze"],
+        schedule_to_start_timeout=SCHEDULE_TO_START_TIMEOUT,
+        start_to_close_timeout=timedelta(minutes=5),
+        retry_policy=RetryPolicy(
+            initial_interval=timedelta(seconds=1),
+            maximum_interval=timedelta(minutes=5),
+            maximum_attempts=3
+        )
+    )
+
+    # Store in Google Sheets
+    sheet_result = await workflow.execute_activity(
+        "store_in_sheets",
+        analysis,
+        task_queue=task_queues["store"],
+        schedule_to_start_timeout=SCHEDULE_TO_START_TIMEOUT,
+        start_to_close_timeout=timedelta(minutes=5),
+        retry_policy=RetryPolicy(
+            initial_interval=timedelta(seconds=1),
+            maximum_interval=timedelta(minutes=5),
+            maximum_attempts=3
+        )
+    )
+
+    return {
+        "team_data": team_data,
+        "analysis": analysis,
+        "storage_result": sheet_result
+    }
@@ -0,0 +1,219 @@
+from datetime import timedelta
+from typing import List, Dict, Any, Optional, Set
+import asyncio
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.exceptions import ApplicationError
+from .aggregator import (
+    SCHEDULE_TO_START_TIMEOUT,
+    SOURCES,
+    analyze_and_store_team,
+    check_task_queues,
+    remove_scraped_teams
+)
+
+REFRESH_OPTIONS = ["interval_seconds", "max_backoff_cycles", "prune_after_cycles"]
+
+def check_refresh_options(options: Dict[str, Any]) -> None:
+    """Fail the workflow unless every refresh option is a positive number.
+
+    Options come only from the starter (settings.REFRESH_*), so the workflow
+    keeps no defaults of its own.
+    """
+    invalid = [
+        name for name in REFRESH_OPTIONS
+        if isinstance(options.get(name), bool)
+        or not isinstance(options.get(name), (int, float))
+        or options[name] <= 0
+    ]
+    if invalid:
+        raise ApplicationError(f"Invalid refresh options: {', '.join(invalid)}", non_retryable=True)
+
+def _team_key(team_data: Dict[str, Any]) -> str:
+    return team_data.get("website_url") or team_data["school_name"]
+
+def _new_freshness() -> Dict[str, Any]:
+    return {
+        "observed_hash": None,
+        "stored_hash": None,
+        "checks": 0,
+        "changes": 0,
+        "last_checked_cycle": 0,
+        "source": None,
+        "missed_listings": 0
+    }
+
+def _change_rate(freshness: Dict[str, Any]) -> float:
+    """Smoothed fraction of checks that found a changed roster; new teams start at 1."""
+    return (freshness["changes"] + 1) / (freshness["checks"] + 1)
+
+def _is_due(freshness: Dict[str, Any], cycle: int, max_backoff_cycles: int) -> bool:
+    """Whether a team should be re-scraped this cycle, backing off for rarely changing teams.
+
+    Teams whose last change has not been stored yet stay due so it is retried.
+    """
+    if freshness["observed_hash"] != freshness["stored_hash"]:
+        return True
+    interval = max(1, min(max_backoff_cycles, round(1 / _change_rate(freshness))))
+    return cycle - freshness["last_checked_cycle"] >= interval
+
+def _observe_teams(
+    teams: Dict[str, Dict[str, Any]],
+    scraped: List[Dict[str, Any]],
+    cycle: int
+) -> Dict[str, Dict[str, Any]]:
+    """Record the content hash of each scraped team (a reference from scrape_source) and return them by key.
+
+    Sources can list the same team (the NCAA divisions share a site), so each
+    team is checked once per cycle however many sources returned it. The
+    change rate only counts real roster changes, not failed attempts to
+    store one.
+    """
+    by_key = {_team_key(team_data): team_data for team_data in scraped}
+    for key, team_data in by_key.items():
+        digest = team_data["content_hash"]
+        freshness = teams.setdefault(key, _new_freshness())
+        if freshness["observed_hash"] is not None:
+            freshness["checks"] += 1
+            if digest != freshness["observed_hash"]:
+                freshness["changes"] += 1
+        freshness["observed_hash"] = digest
+        freshness["last_checked_cycle"] = cycle
+        freshness["missed_listings"] = 0
+    return by_key
+
+def _update_listings(teams: Dict[str, Dict[str, Any]], listed: Dict[str, Set[str]]) -> None:
+    """Count, per team, consecutive listings of its source that left it out.
+
+    listed maps each source whose team list was fetched this cycle to the
+    URLs it listed. A team's count only advances when its own source's
+    listing succeeded, so a failed fetch never ages it.
+    """
+    for key, freshness in teams.items():
+        sources = [division for division, urls in listed.items() if key in urls]
+        if sources:
+            if freshness["source"] not in sources:
+                freshness["source"] = sources[0]
+            freshness["missed_listings"] = 0
+        elif freshness["source"] in listed:
+            freshness["missed_listings"] += 1
+
+@workflow.defn
+class RefreshWorkflow:
+    """Periodically refresh teams, analyzing and storing only those whose content changed.
+
+    Each run is one cycle; the workflow continues as new after sleeping for
+    the configured interval, carrying per-team freshness state forward.
+    """
+
+    def __init__(self) -> None:
+        self._last_cycle: Dict[str, Any] = {}
+
+    @workflow.query
+    def last_cycle(self) -> Dict[str, Any]:
+        return self._last_cycle
+
+    @workflow.run
+    async def run(
+        self,
+        state: Optional[Dict[str, Any]],
+        task_queues: Dict[str, str],
+        options: Dict[str, Any]
+    ) -> None:
+        check_task_queues(task_queues)
+        check_refresh_options(options)
+        state = state or {"cycle": 0, "teams": {}, "last_cycle": {}}
+        self._last_cycle = state["last_cycle"]
+        teams: Dict[str, Dict[str, Any]] = state["teams"]
+        cycle = state["cycle"] + 1
+
+        # Leave teams that are not yet due out of this cycle's scrape
+        skip_urls = [
+            key for key, freshness in teams.items()
+            if not _is_due(freshness, cycle, options["max_backoff_cycles"])
+        ]
+
+        scraped = []
+        directories = []
+        # Team URLs by source, for sources whose team list was fetched; a
+        # failed listing fails the source's scrape, leaving it out
+        listed: Dict[str, Set[str]] = {}
+        for source in SOURCES:
+            try:
+                result = await workflow.execute_child_workflow(
+                    "ScrapeSourceWorkflow",
+                    args=[source, task_queues, skip_urls],
+                    id=f"{workflow.info().workflow_id}-scrape-{source['division'].lower()}",
+                    task_queue=task_queues["workflow"],
+                    retry_policy=RetryPolicy(
+                        initial_interval=timedelta(seconds=1),
+                        maximum_interval=timedelta(minutes=10),
+                        maximum_attempts=3,
+                        non_retryable_error_types=["ValueError"]
+                    )
+                )
+                scraped.extend(result["teams"])
+                directories.append(result["directory"])
+                listed[source["division"]] = set(result["listed_urls"])
+            except Exception as e:
+                workflow.logger.error(f"Error in child workflow for {source['name']}: {str(e)}")
+
+        skipped = len(set().union(*listed.values()).intersection(skip_urls))
+
+        # Detect changes against the last observed content
+        observed = _observe_teams(teams, scraped, cycle)
+        _update_listings(teams, listed)
+        changed = [
+            team_data for key, team_data in observed.items()
+            if teams[key]["observed_hash"] != teams[key]["stored_hash"]
+        ]
+        unchanged = len(observed) - len(changed)
+
+        # Refresh the most frequently changing teams first
+        changed.sort(key=lambda team_data: _change_rate(teams[_team_key(team_data)]), reverse=True)
+
+        refreshed = []
+        for team_data in changed:
+            try:
+                refreshed.append(await analyze_and_store_team(team_data, task_queues))
+                freshness = teams[_team_key(team_data)]
+                freshness["stored_hash"] = freshness["observed_hash"]
+            except Exception as e:
+                workflow.logger.error(f"Error processing team {team_data.get('school_name')}: {str(e)}")
+
+        # Forget teams that have dropped off their source's team list
+        pruned = [
+            key for key, freshness in teams.items()
+            if freshness["missed_listings"] >= options["prune_after_cycles"]
+        ]
+        for key in pruned:
+            del teams[key]
+
+        if refreshed:
+            await workflow.execute_activity(
+                "store_results",
+                refreshed,
+                task_queue=task_queues["store"],
+                schedule_to_start_timeout=SCHEDULE_TO_START_TIMEOUT,
+                start_to_close_timeout=timedelta(minutes=5)
+            )
+        await remove_scraped_teams(directories, task_queues)
+
+        self._last_cycle = {
+            "cycle": cycle,
+            "skipped_not_due": skipped,
+            "skipped_unchanged": unchanged,
+            "refreshed": len(refreshed),
+            "failed": len(changed) - len(refreshed),
+            "pruned": len(pruned)
+        }
+        workflow.logger.info(
+            f"Refresh cycle {cycle}: {len(refreshed)} refreshed, "
+            f"{skipped} skipped (not due), {unchanged} skipped (unchanged), "
+            f"{len(changed) - len(refreshed)} failed, {len(pruned)} pruned"
+        )
+
+        await asyncio.sleep(options["interval_seconds"])
+        workflow.continue_as_new(
+            args=[{"cycle": cycle, "teams": teams, "last_cycle": self._last_cycle}, task_queues, options]
+        )